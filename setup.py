@@ -22,14 +22,12 @@ CLASSIFIERS = [
     "Natural Language :: English",
     "Operating System :: OS Independent",
     "Programming Language :: Python",
-    "Programming Language :: Python :: 2",
     "Programming Language :: Python :: 3",
     "Topic :: Scientific/Engineering",
 ]
 INSTALL_REQUIRES = [
     'argparse',  # Python command-line parsing library
     'euclid3',  # 2D and 3D vector, matrix, quaternion and geometry module.
-    'six',  # Python 2 and 3 compatibility utilities
 ]
 SCRIPTS = [
     'scripts/pygcode-norm',
@@ -1,4 +1,3 @@
-import re
 from .words import text2words
 from .gcodes import words2gcodes
 from . import dialects
@@ -6,6 +5,7 @@ from . import dialects
 
 class Block(object):
     """GCode block (effectively any gcode file line that defines any <word><value>)"""
+    __slots__ = ('_raw_text', '_text', 'words', 'gcodes', 'modal_params', 'dialect', '_word_map')
 
     def __init__(self, text=None, dialect=None, verify=True):
         """
@@ -32,22 +32,25 @@ class Block(object):
             dialect = dialects.get_default()
         self.dialect = dialect
 
-        self._word_map = getattr(getattr(dialects, dialect), 'WORD_MAP')
+        self._word_map = dialects._resolve(dialect).WORD_MAP
 
         # clean up block string
         if text:
             self._raw_text = text  # unaltered block content (before alteration)
-            text = re.sub(r'(^\s+|\s+$)', '', text) # remove whitespace padding
-            text = re.sub(r'\s+', ' ', text) # remove duplicate whitespace with ' '
+            # remove whitespace padding, and replace duplicate whitespace with ' '
+            # (equivalent to stripping then re.sub(r'\s+', ' ', ...), but faster)
+            text = ' '.join(text.split())
             self._text = text  # cleaned up block content
 
-            # Get words from text, and group into gcodes
-            self.words = list(text2words(self._text))
-            (self.gcodes, self.modal_params) = words2gcodes(self.words)
+            # Whitespace (or comment) only lines have no words; skip parsing
+            if text:
+                # Get words from text, and group into gcodes
+                self.words = list(text2words(self._text))
+                (self.gcodes, self.modal_params) = words2gcodes(self.words)
 
-            # Verification
-            if verify:
-                self._assert_gcodes()
+                # Verification
+                if verify:
+                    self._assert_gcodes()
 
     @property
     def text(self):
@@ -79,18 +82,21 @@ class Block(object):
                 modal_groups.add(gc.modal_group)
 
     def __getattr__(self, k):
-        if k in self._word_map:
+        # private & dunder attributes are never words (also avoids recursion
+        # when attributes are requested before __init__ has set them)
+        if (k[:1] != '_') and (k in self._word_map):
+            # first word of that letter (self.words is scanned on each
+            # request, as it may have been changed since it was parsed)
             for w in self.words:
                 if w.letter == k:
                     return w
-            # if word is not in this block:
+            # if word is not in this block: None
             return None
 
-        else:
-            raise AttributeError("'{cls}' object has no attribute '{key}'".format(
-                cls=self.__class__.__name__,
-                key=k
-            ))
+        raise AttributeError("'{cls}' object has no attribute '{key}'".format(
+            cls=self.__class__.__name__,
+            key=k
+        ))
 
     def __len__(self):
         """
@@ -108,4 +114,4 @@ class Block(object):
     __nonzero__ = __bool__  # python < 3 compatability
 
     def __str__(self):
-        return ' '.join(str(x) for x in (self.gcodes + self.modal_params))
+        return ' '.join([str(x) for x in self.gcodes] + [str(x) for x in self.modal_params])
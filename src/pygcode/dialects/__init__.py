@@ -22,6 +22,12 @@ from . import reprap
 
 _DEFAULT = 'linuxcnc'
 
+# Dialect modules, by name
+_DIALECT_MAP = {
+    'linuxcnc': linuxcnc,
+    'reprap': reprap,
+}
+
 
 def get_default():
     """
@@ -51,5 +57,17 @@ def set_default(name):
 
     """
 
+    global _DEFAULT
     # TODO: verify valid name
     _DEFAULT = name
+
+
+def _resolve(name=None):
+    """
+    Get dialect module by name
+    :param name: name of dialect (if None, the default dialect is used)
+    :return: dialect module (eg: :mod:`pygcode.dialects.linuxcnc`)
+    """
+    if name is None:
+        name = _DEFAULT
+    return _DIALECT_MAP[name]
@@ -14,25 +14,50 @@ TODO: verify above info before publishing
 
 import re
 
-from .utils import WordType
+from .utils import WordType, word_scanner
 
 # ======================== WORDS ========================
 
-REGEX_FLOAT = re.compile(r'^\s*-?(\d+\.?\d*|\.\d+)') # testcase: ..tests.test_words.WordValueMatchTests.test_float
-REGEX_INT = re.compile(r'^\s*-?\d+')
-REGEX_POSITIVEINT = re.compile(r'^\s*\d+')
-REGEX_CODE = re.compile(r'^\s*\d+(\.\d)?') # float, but can't be negative
+# (whitespace between a word's letter and value is skipped by the WORD_SCANNER)
+REGEX_FLOAT = re.compile(r'^-?(?:\d+(?:\.\d*)?|\.\d+)') # testcase: ..tests.test_words.WordValueMatchTests.test_float
+REGEX_INT = re.compile(r'^-?\d+')
+REGEX_POSITIVEINT = re.compile(r'^\d+')
+REGEX_CODE = re.compile(r'^\d+(?:\.\d)?') # float, but can't be negative
+REGEX_ALL = re.compile(r'^.+$') # all the way to the end
 
 # Value cleaning functions
+_CODE_STR_MAP = dict((float(i), "%02i" % i) for i in range(100))  # {1.0: '01', ... }
+
 def _clean_codestr(value):
+    # integer codes (by far the most common) are looked up
+    code_str = _CODE_STR_MAP.get(value)
+    if code_str is not None:
+        return code_str
     if value < 10:
         return "0%g" % value
     return "%g" % value
 
-CLEAN_NONE = lambda v: v
-CLEAN_FLOAT = lambda v: "{0:g}".format(round(v, 3))
+def _clean_floatstr(value):
+    # '%' formatting gives the same result as "{0:g}".format(), faster
+    return "%g" % round(value, 3)
+
+def _clean_wholefloatstr(value):
+    # for values that are usually whole numbers (eg: F1200, S8000, P1)
+    if value.is_integer() and (-1e6 < value < 1e6):  # (beyond: '%g' gives exponent notation)
+        return "%i" % value
+    return "%g" % round(value, 3)
+
+def _clean_intstr(value):
+    return "%i" % value
+
+def _clean_none(value):
+    return value
+
+CLEAN_NONE = _clean_none
+CLEAN_FLOAT = _clean_floatstr
+CLEAN_FLOAT_WHOLE = _clean_wholefloatstr
 CLEAN_CODE = _clean_codestr
-CLEAN_INT = lambda v: "%g" % v
+CLEAN_INT = _clean_intstr
 
 WORD_MAP = {
     # Descriptions copied from wikipedia:
@@ -74,7 +99,7 @@ WORD_MAP = {
         cls=float,
         value_regex=REGEX_FLOAT,
         description="Feedrate",
-        clean_value=CLEAN_FLOAT,
+        clean_value=CLEAN_FLOAT_WHOLE,
     ),
     # G-Codes
     'G': WordType(
@@ -88,7 +113,7 @@ WORD_MAP = {
         cls=float,
         value_regex=REGEX_FLOAT,
         description="Defines tool length offset; Incremental axis corresponding to C axis (e.g., on a turn-mill)",
-        clean_value=CLEAN_FLOAT,
+        clean_value=CLEAN_FLOAT_WHOLE,
     ),
     # Arc radius center coords
     'I': WordType(
@@ -133,7 +158,7 @@ WORD_MAP = {
     # Program Name
     'O': WordType(
         cls=str,
-        value_regex=re.compile(r'^.+$'), # all the way to the end
+        value_regex=REGEX_ALL,
         description="Program name",
         clean_value=CLEAN_NONE,
     ),
@@ -142,7 +167,7 @@ WORD_MAP = {
         cls=float, # parameter is often an integer, but can be a float
         value_regex=REGEX_FLOAT,
         description="Serves as parameter address for various G and M codes",
-        clean_value=CLEAN_FLOAT,
+        clean_value=CLEAN_FLOAT_WHOLE,
     ),
     # Peck increment
     'Q': WordType(
@@ -163,7 +188,7 @@ WORD_MAP = {
         cls=float,
         value_regex=REGEX_FLOAT,
         description="Defines speed, either spindle speed or surface speed depending on mode",
-        clean_value=CLEAN_FLOAT,
+        clean_value=CLEAN_FLOAT_WHOLE,
     ),
     # Tool Selecton
     'T': WordType(
@@ -212,5 +237,9 @@ WORD_MAP = {
     ),
 }
 
+# Single regex to identify all words in a block
+#   (ordered by letters' typical frequency in milling g-code)
+WORD_SCANNER = word_scanner(WORD_MAP, common_letters='GXYZIJNFM')
+
 
 # ======================== G-CODES ========================
@@ -1,9 +1,46 @@
+import re
 
 # Data Classes
 
 class WordType(object):
+    __slots__ = ('cls', 'value_regex', 'value_match', 'description', 'clean_value')
+
     def __init__(self, cls, value_regex, description, clean_value):
         self.cls = cls
         self.value_regex = value_regex
+        self.value_match = value_regex.match  # bound once (used per parsed word)
         self.description = description
         self.clean_value = clean_value
+
+
+# Utilities
+
+def word_scanner(word_map, common_letters=''):
+    """
+    Compile a single regex to iterate through all words in a block of text
+    :param word_map: dict of the form: {<letter>: WordType(...), ... }
+    :param common_letters: letters to test first (most frequently used first)
+    :return: compiled regex
+
+    Each word is matched as ``<letter><value>``, where the letter's value
+    pattern is taken from its ``WordType.value_regex`` (whitespace between
+    the two is skipped, so value patterns need not match it). The value is captured
+    in a group named after the (upper case) letter, so for any match:
+    ``letter = match.lastgroup`` and ``value = match.group(letter)``.
+    Letters with an invalid value are matched by the ``_invalid`` group.
+    """
+    # Branches are attempted in order; the sooner a common letter is found,
+    # the fewer branches are evaluated for each word.
+    letter_order = [l for l in common_letters if l in word_map]
+    letter_order += sorted(l for l in word_map if l not in letter_order)
+
+    branches = []
+    for letter in letter_order:
+        value_pattern = word_map[letter].value_regex.pattern
+        assert value_pattern.startswith('^'), "value_regex must be anchored: %r" % value_pattern
+        branches.append(r'{letter}\s*(?P<{letter}>{value})'.format(
+            letter=letter,
+            value=value_pattern[1:],
+        ))
+    branches.append('(?P<_invalid>[%s])' % ''.join(sorted(word_map.keys())))
+    return re.compile('|'.join(branches), re.IGNORECASE)
@@ -1,18 +1,28 @@
 
+# ===================== Base Exceptions =====================
+class PyGCodeError(Exception):
+    """Base of all exceptions raised by pygcode"""
+
+class GCodeParsingError(PyGCodeError):
+    """Base of exceptions raised while parsing gcode"""
+
+class MachineError(PyGCodeError):
+    """Base of exceptions raised while processing gcode on a Machine"""
+
 # ===================== Parsing Exceptions =====================
-class GCodeBlockFormatError(Exception):
+class GCodeBlockFormatError(GCodeParsingError):
     """Raised when errors encountered while parsing block text"""
 
-class GCodeParameterError(Exception):
+class GCodeParameterError(GCodeParsingError):
     """Raised for conflicting / invalid / badly formed parameters"""
 
-class GCodeWordStrError(Exception):
+class GCodeWordStrError(GCodeParsingError):
     """Raised when issues found while parsing a word string"""
 
 # ===================== Machine Exceptions =====================
-class MachineInvalidAxis(Exception):
+class MachineInvalidAxis(MachineError):
     """Raised if an axis is invalid"""
     # For example: for axes X/Y/Z, set the value of "Q"; wtf?
 
-class MachineInvalidState(Exception):
+class MachineInvalidState(MachineError):
     """Raised if a machine state is set incorrectly, or in conflict"""
@@ -1,13 +1,27 @@
-import sys
-from collections import defaultdict
 from copy import copy
-import six
+from operator import attrgetter
 
 from .utils import Vector3, Quaternion, quat2coord_system
 from .words import Word, text2words
 
 from .exceptions import GCodeParameterError, GCodeWordStrError
 
+_NUMERIC_TYPES = (int, float)  # word values accepted as a gcode's first parameter
+
+_machine = None  # machine module (see _machine_module)
+
+
+def _machine_module():
+    """
+    Import machine module, on first call only
+    (importing up; done live to avoid dependency loop)
+    :return: pygcode.machine module
+    """
+    global _machine
+    if _machine is None:
+        from . import machine as _machine
+    return _machine
+
 # Terminology of a "G-Code"
 #   For the purposes of this library, so-called "G" codes do not necessarily
 #   use the letter "G" in their word; other letters include M, F, S, and T
@@ -137,9 +151,121 @@ MODAL_GROUP_MAP = {
 #       250: Stop (M0, M1, M2, M30, M60).
 
 
-class GCode(object):
+def _param_property(letter):
+    """
+    Property giving access to a gcode's parameter value (eg: ``gcode.X``)
+    :param letter: parameter letter (eg: 'X')
+    :return: property instance
+    """
+    def fget(self):
+        params = self.params
+        if letter in params:
+            return params[letter].value
+        elif letter in self.param_letters:
+            return None  # parameter is valid for GCode, but undefined
+        raise AttributeError("'{cls}' object has no attribute '{key}'".format(
+            cls=self.__class__.__name__,
+            key=letter
+        ))
+
+    def fset(self, value):
+        if letter in self.params:
+            self.params[letter].value = value
+        else:
+            self.add_parameter(Word(letter, value))
+
+    return property(fget, fset, doc="G-Code %s parameter value" % letter)
+
+
+_PARAM_PROPERTIES = {}  # {<letter>: <property>, ... }
+_FROZENSET_CACHE = {}  # {<frozenset>: <frozenset>, ... } (shared letter sets)
+
+
+def _letter_set(letters):
+    """
+    Immutable set of the given parameter letters, shared between classes
+    defining the same letters.
+    :param letters: iterable of letters
+    :return: frozenset instance
+    """
+    letters = frozenset(letters)
+    return _FROZENSET_CACHE.setdefault(letters, letters)
+
+
+# GCode Word Mapping (populated as GCode classes are defined)
+_gcode_word_map = {} # of the form: {Word('G', 0): GCodeRapidMove, ... }
+_gcode_letter_map = {} # of the form: {'F': GCodeFeedRate, ... }
+_gcode_function_list = [] # of the form: [(lambda w: w.letter == 'F', GCodeFeedRate), ... ]
+_gcode_class_cache = {} # word_gcode_class results, of the form: {('G', 0): GCodeRapidMove, ... }
+
+
+def _register_gcode_class(cls):
+    """
+    Add gcode class to _gcode_word_map, _gcode_letter_map, or
+    _gcode_function_list (used by word_gcode_class to identify the gcode a
+    word defines)
+    :param cls: class inheriting GCode
+
+    Only word definitions declared by the class itself are registered;
+    a subclass inheriting them (eg: ``class MyRapid(GCodeRapidMove)``) is not
+    registered, so its words still map to the parent class.
+    """
+    _gcode_class_cache.clear()  # cached results may change
+    declared = cls.__dict__
+    word_keys = declared.get('word_key_candidates', ())
+    if declared.get('word_key') is not None:
+        word_keys = (cls.word_key,)
+    if word_keys:
+        # Map Word instance(s) to g-code class
+        for word_key in word_keys:
+            if word_key in _gcode_word_map:
+                raise RuntimeError("Multiple GCode classes map to '%s'" % str(word_key))
+            _gcode_word_map[word_key] = cls
+    elif declared.get('word_letter_match'):
+        # Map all words of letter to g-code class
+        if cls.word_letter in _gcode_letter_map:
+            raise RuntimeError("Multiple GCode classes map to '%s' words" % cls.word_letter)
+        _gcode_letter_map[cls.word_letter] = cls
+    elif declared.get('word_matches') is not None:
+        # Add to list of functions
+        _gcode_function_list.append((cls.word_matches, cls))
+
+
+class GCodeMeta(type):
+    """
+    Metaclass of all GCode classes.
+    Freezes the class' param_letters and modal_param_letters, and creates a
+    property for each parameter letter; parameter values are then accessed as
+    attributes (eg: ``GCodeLinearMove(X=1).X``) without a __getattr__ call
+    per access.
+    Each class is also registered in the word -> gcode class lookup tables,
+    including classes defined outside this module.
+    """
+    def __new__(mcs, name, bases, namespace):
+        if namespace.get('__module__') == __name__:
+            # gcodes defined here add no instance attributes to GCode's own
+            # __slots__ (classes defined elsewhere keep their __dict__)
+            namespace.setdefault('__slots__', ())
+        return super(GCodeMeta, mcs).__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name, bases, namespace):
+        super(GCodeMeta, cls).__init__(name, bases, namespace)
+        cls.param_letters = _letter_set(cls.param_letters)
+        cls.modal_param_letters = _letter_set(cls.modal_param_letters)
+        cls._param_order = tuple(sorted(cls.param_letters))  # str() & repr() order
+        for letter in cls.param_letters:
+            if letter not in _PARAM_PROPERTIES:
+                _PARAM_PROPERTIES[letter] = _param_property(letter)
+            if getattr(cls, letter, None) is not _PARAM_PROPERTIES[letter]:
+                setattr(cls, letter, _PARAM_PROPERTIES[letter])
+        _register_gcode_class(cls)
+
+
+class GCode(object, metaclass=GCodeMeta):
     # Defining Word
     word_key = None # Word instance to use in lookup
+    word_key_candidates = () # Word instances to use in lookup (if more than 1)
+    word_letter_match = False # if set, all words of word_letter map to this gcode (eg: F100)
     word_matches = None # function (secondary)
     default_word = None
     word_letter = 'G'
@@ -155,6 +281,12 @@ class GCode(object):
     # Execution Order
     exec_order = 999  # if not otherwise specified, run last
 
+    __slots__ = (
+        'word',  # Word instance defining gcode
+        'params',  # {<letter>: <Word>, ... }
+        '_whitespace_word',  # if True, str(self) will replace self.word code with whitespace
+    )
+
     def __init__(self, *words, **params):
         """
         :param word: Word instance defining gcode (eg: Word('G0') for rapid movement)
@@ -164,17 +296,14 @@ class GCode(object):
         param_words = words[1:]
         if gcode_word_list:
             gcode_word = gcode_word_list[0]
-            if self.word_value_configurable and isinstance(gcode_word, six.integer_types + (float,)):
+            if self.word_value_configurable and isinstance(gcode_word, _NUMERIC_TYPES):
                 gcode_word = Word(self.word_letter, gcode_word)  # cast to Word()
         else:
             gcode_word = self._default_word()
         assert isinstance(gcode_word, Word), "invalid gcode word %r" % gcode_word
         self.word = gcode_word
         self.params = {}
-
-        # Whitespace as prefix
-        #   if True, str(self) will repalce self.word code with whitespace
-        self._whitespace_prefix = False
+        self._whitespace_word = False
 
         # Add Given Parameters
         for param_word in param_words:
@@ -187,7 +316,7 @@ class GCode(object):
         if self.params:
             param_str = "{%s}" % (', '.join([
                 "{}".format(self.params[k])
-                for k in sorted(self.params.keys())
+                for k in self._param_order if k in self.params
             ]))
         return "<{class_name}: {gcode}{params}>".format(
             class_name=self.__class__.__name__,
@@ -201,16 +330,25 @@ class GCode(object):
         if self.params:
             param_str += ' ' + ' '.join([
                 "{}".format(self.params[k])
-                for k in sorted(self.params.keys())
+                for k in self._param_order if k in self.params
             ])
         word_str = str(self.word)
-        if self._whitespace_prefix:
-            word_str = ' ' * len(word_str)
+        if self._whitespace_word:
+            word_str = ' ' * len(word_str)  # (padded to the current word)
         return "{word_str}{parameters}".format(
             word_str=word_str,
             parameters=param_str,
         )
 
+    @property
+    def _whitespace_prefix(self):
+        """if True, str(self) will replace self.word code with whitespace"""
+        return self._whitespace_word
+
+    @_whitespace_prefix.setter
+    def _whitespace_prefix(self, value):
+        self._whitespace_word = bool(value)
+
     def _default_word(self):
         if self.default_word:
             return copy(self.default_word)
@@ -229,6 +367,7 @@ class GCode(object):
         return not self.__eq__(other)
 
     # Sort by execution order
+    #   (sorting with key=_EXEC_ORDER_KEY is equivalent, and faster)
     def __lt__(self, other):
         return self.exec_order < other.exec_order
 
@@ -266,29 +405,6 @@ class GCode(object):
         # to be overridden in inheriting classes
         pass
 
-    def __getattr__(self, key):
-        # Return parameter values (if valid parameter for gcode)
-        if key in self.param_letters:
-            if key in self.params:
-                return self.params[key].value
-            else:
-                return None # parameter is valid for GCode, but undefined
-
-        raise AttributeError("'{cls}' object has no attribute '{key}'".format(
-            cls=self.__class__.__name__,
-            key=key
-        ))
-
-    def __setattr__(self, key, value):
-        if key in self.param_letters:
-            if key in self.params:
-                self.params[key].value = value
-            else:
-                self.add_parameter(Word(key, value))
-
-        else:
-            self.__dict__[key] = value
-
     @property
     def description(self):
         return self.__doc__
@@ -305,16 +421,16 @@ class GCode(object):
         Get gcode parameters as a dict
         gcode parameter like "X3.1, Y-2" would return {'X': 3.1, 'Y': -2}
         :param letters: iterable whitelist of letters to include as dict keys
+                        (a set is best, eg: ``machine.axes``)
         :param lc: lower case parameter letters
         :return: dict of gcode parameters' (letter, value) pairs
         """
-        letter_mod = lambda x: x
+        params = self.params
         if lc:
-            letter_mod = lambda x: x.lower()
-        return dict(
-            (letter_mod(w.letter), w.value) for w in self.params.values()
-            if (letters is None) or (w.letter in letters)
-        )
+            return {l.lower(): w.value for (l, w) in params.items() if (letters is None) or (l in letters)}
+        elif letters is None:
+            return {l: w.value for (l, w) in params.items()}
+        return {l: w.value for (l, w) in params.items() if l in letters}
 
     # Process GCode
     def process(self, machine):
@@ -323,8 +439,7 @@ class GCode(object):
         :param machine: Machine instance, to change state
         :return: GCodeEffect instance; effect the gcode just had on machine
         """
-        from .machine import Machine  # importing up (done live to avoid dependency loop)
-        assert isinstance(machine, Machine), "invalid machine type: %r" % machine
+        assert isinstance(machine, _machine_module().Machine), "invalid machine type: %r" % machine
 
         # Set mode
         self._process_mode(machine)
@@ -354,12 +469,9 @@ class GCodeLineNumber(GCodeDefinition):
     """N: Line Number"""
     word_letter = 'N'
     word_value_configurable = True
+    word_letter_match = True
     exec_order = 0
 
-    @classmethod
-    def word_matches(cls, w):
-        return w.letter == 'N'
-
     @property
     def number(self):
         return self.word.value
@@ -369,12 +481,9 @@ class GCodeProgramName(GCodeDefinition):
     """O: Program Name"""
     word_letter = 'O'
     word_value_configurable = True
+    word_letter_match = True
     exec_order = 1
 
-    @classmethod
-    def word_matches(cls, w):
-        return w.letter == 'O'
-
     @property
     def name(self):
         return self.word.value
@@ -421,28 +530,29 @@ class GCodeArcMove(GCodeMotion):
     """Arc Move"""
     param_letters = GCodeMotion.param_letters | set('IJKRP')
 
+    # Parameter groups
+    _PARAMS_XYZ = frozenset('XYZ')
+    _PARAMS_IJK = frozenset('IJK')
+
     def assert_params(self):
-        param_letters = set(self.params.keys())
-        # Parameter groups
-        params_xyz = set('XYZ') & set(param_letters)
-        params_ijk = set('IJK') & set(param_letters)
-        params_r = set('R') & set(param_letters)
-        params_ijkr = params_ijk | params_r
+        param_letters = self.params.keys()
+        has_ijk = not param_letters.isdisjoint(self._PARAMS_IJK)
+        has_r = 'R' in param_letters
 
         # --- Parameter Groups
         # XYZ: at least 1
-        if not params_xyz:
-            raise GCodeParameterError("no XYZ parameters set for destination: %r" % arc_gcode)
+        if param_letters.isdisjoint(self._PARAMS_XYZ):
+            raise GCodeParameterError("no XYZ parameters set for destination: %r" % self)
         # IJK or R: only in 1 group
-        if params_ijk and params_r:
-            raise GCodeParameterError("both IJK and R parameters defined: %r" % arc_gcode)
+        if has_ijk and has_r:
+            raise GCodeParameterError("both IJK and R parameters defined: %r" % self)
         # IJKR: at least 1
-        if not params_ijkr:
-            raise GCodeParameterError("neither IJK or R parameters defined: %r" % arc_gcode)
+        if not (has_ijk or has_r):
+            raise GCodeParameterError("neither IJK or R parameters defined: %r" % self)
 
         # --- Parameter Values
-        if params_r and (self.R == 0):
-            raise GCodeParameterError("cannot plot a circle with a radius of zero: %r" % arc_gcode)
+        if has_r and (self.R == 0):
+            raise GCodeParameterError("cannot plot a circle with a radius of zero: %r" % self)
 
 
 class GCodeArcMoveCW(GCodeArcMove):
@@ -491,9 +601,7 @@ class GCodeNURBSEnd(GCodeNURBS):
 
 class GCodeStraightProbe(GCodeMotion):
     """G38.2-G38.5: Straight Probe"""
-    @classmethod
-    def word_matches(cls, w):
-        return (w.letter == 'G') and (38.2 <= w.value <= 38.5)
+    word_key_candidates = tuple(Word('G', v) for v in (38.2, 38.3, 38.4, 38.5))
     default_word = Word('G', 38.2)
 
 
@@ -544,14 +652,13 @@ class GCodeCannedCycle(GCode):
 
     def _process(self, machine):
         moveto_coords = self.get_param_dict(letters=machine.axes)
+        normal_axis = machine.mode.plane_selection.normal_axis
         if isinstance(machine.mode.canned_cycles_return, GCodeCannedCycleReturnToR):
-            # canned return is to this.R, not this.Z (plane dependent)
-            moveto_coords.update({
-                machine.mode.plane_selection.normal_axis: self.R,
-            })
+            # canned return is to self.R, not self.Z (plane dependent)
+            moveto_coords[normal_axis] = self.R
         else:  # default: GCodeCannedCycleReturnPrevLevel
-            # Remove this.Z (plane dependent) value (ie: no machine movement on this axis)
-            moveto_coords.pop(machine.mode.plane_selection.normal_axis, None)
+            # Remove self.Z (plane dependent) value (ie: no machine movement on this axis)
+            moveto_coords.pop(normal_axis, None)
 
         # Process action 'L' times
         loop_count = self.L
@@ -1038,9 +1145,7 @@ class GCodeFeedRate(GCodeOtherModal):
     """F: Set Feed Rate"""
     word_letter = 'F'
     word_value_configurable = True
-    @classmethod
-    def word_matches(cls, w):
-        return w.letter == 'F'
+    word_letter_match = True
     default_word = Word('F', 0)
     modal_group = MODAL_GROUP_MAP['feed_rate']
     exec_order = 40
@@ -1050,9 +1155,7 @@ class GCodeSpindleSpeed(GCodeOtherModal):
     """S: Set Spindle Speed"""
     word_letter = 'S'
     word_value_configurable = True
-    @classmethod
-    def word_matches(cls, w):
-        return w.letter == 'S'
+    word_letter_match = True
     default_word = Word('S', 0)
     # Modal Group: (see description in GCodeFeedRate)
     modal_group = MODAL_GROUP_MAP['spindle_speed']
@@ -1063,9 +1166,7 @@ class GCodeSelectTool(GCodeOtherModal):
     """T: Select Tool"""
     word_letter = 'T'
     word_value_configurable = True
-    @classmethod
-    def word_matches(cls, w):
-        return w.letter == 'T'
+    word_letter_match = True
     default_word = Word('T', 0)
     # Modal Group: (see description in GCodeFeedRate)
     modal_group = MODAL_GROUP_MAP['tool']
@@ -1299,18 +1400,14 @@ class GCodeSet(GCodeNonModal):
 
 class GCodeGotoPredefinedPosition(GCodeNonModal):
     """G28,G30: Goto Predefined Position (rapid movement)"""
-    @classmethod
-    def word_matches(cls, w):
-        return (w.letter == 'G') and (w.value in [28, 30])
+    word_key_candidates = (Word('G', 28), Word('G', 30))
     default_word = Word('G', 28)
     exec_order = 230
 
 
 class GCodeSetPredefinedPosition(GCodeNonModal):
     """G28.1,G30.1: Set Predefined Position"""  # redundancy in language there, but I'll let it slide
-    @classmethod
-    def word_matches(cls, w):
-        return (w.letter == 'G') and (w.value in [28.1, 30.1])
+    word_key_candidates = (Word('G', 28.1), Word('G', 30.1))
     default_word = Word('G', 28.1)
     exec_order = 230
 
@@ -1329,9 +1426,7 @@ class GCodeCoordSystemOffset(GCodeNonModal):
 
 class GCodeResetCoordSystemOffset(GCodeNonModal):
     """G92.1,G92.2: Reset Coordinate System Offset"""
-    @classmethod
-    def word_matches(cls, w):
-        return (w.letter == 'G') and (w.value in [92.1, 92.2])
+    word_key_candidates = (Word('G', 92.1), Word('G', 92.2))
     default_word = Word('G', 92.1)
     exec_order = 230
 
@@ -1400,34 +1495,28 @@ def _gcode_class_infostr(base_class=GCode, prefix=''):
 
 
 # ======================= GCode Word Mapping =======================
-_gcode_maps_created = False  # only set when the below values are populated
-_gcode_word_map = {} # of the form: {Word('G', 0): GCodeRapidMove, ... }
-_gcode_function_list = [] # of the form: [(lambda w: w.letter == 'F', GCodeFeedRate), ... ]
-
 
 def build_maps():
-    """Populate _gcode_word_map and _gcode_function_list"""
+    """
+    Re-populate _gcode_word_map, _gcode_letter_map, and _gcode_function_list
+    (not normally required; all GCode classes are registered when defined)
+    """
     # Ensure Word maps / lists are clear
-    global _gcode_word_map
-    global _gcode_function_list
-    _gcode_word_map = {}
-    _gcode_function_list = []
+    del _gcode_function_list[:]
+    _gcode_word_map.clear()
+    _gcode_letter_map.clear()
+    _gcode_class_cache.clear()
 
     for cls in _subclasses(GCode):
-        if cls.word_key is not None:
-            # Map Word instance to g-code class
-            if cls.word_key in _gcode_word_map:
-                raise RuntimeError("Multiple GCode classes map to '%s'" % str(cls.word_key))
-            _gcode_word_map[cls.word_key] = cls
-        elif cls.word_matches is not None:
-            # Add to list of functions
-            _gcode_function_list.append((cls.word_matches, cls))
-
-    global _gcode_maps_created
-    _gcode_maps_created = True
+        _register_gcode_class(cls)
 
 
 # ======================= Words -> GCodes =======================
+# Letters of words that may define a gcode (all other letters are parameters)
+# TODO: get valid world letters from dialect
+_GCODE_WORD_LETTERS = frozenset('GMFSTNO')
+
+
 def word_gcode_class(word, exhaustive=False):
     """
     Map word to corresponding GCode class
@@ -1436,30 +1525,42 @@ def word_gcode_class(word, exhaustive=False):
     :return: class inheriting GCode
     """
 
-    if not _gcode_maps_created:
-        build_maps()
-
     # quickly eliminate parameters
-    # TODO: get valid world letters from dialect
-    if (not exhaustive) and (word.letter not in 'GMFSTNO'):
+    if (not exhaustive) and (word.letter not in _GCODE_WORD_LETTERS):
         return None
 
-    # by Word Map (faster)
-    if word in _gcode_word_map:
-        return _gcode_word_map[word]
+    # by Letter Map (letters are not in the Word Map, see test_gcodes.py)
+    if word.letter in _gcode_letter_map:
+        return _gcode_letter_map[word.letter]
 
-    # by Function List (slower, so checked last)
-    for (match_function, gcode_class) in _gcode_function_list:
-        if match_function(word):
-            return gcode_class
+    # by previous result (a (letter, value) tuple hashes, and compares,
+    # without the Word methods being called)
+    key = (word.letter, word.value)
+    if key in _gcode_class_cache:
+        return _gcode_class_cache[key]
 
-    return None
+    gcode_class = None
+    if word in _gcode_word_map:
+        # by Word Map (faster)
+        gcode_class = _gcode_word_map[word]
+    else:
+        # by Function List (slower, so checked last)
+        for (match_function, function_class) in _gcode_function_list:
+            if match_function(word):
+                gcode_class = function_class
+                break
+
+    if word.letter in _GCODE_WORD_LETTERS:
+        # only gcode letters are cached; caching every parameter word (when
+        # exhaustive) would grow the cache with each new X, Y, Z... value
+        _gcode_class_cache[key] = gcode_class
+    return gcode_class
 
 
 def words2gcodes(words):
     """
     Group words into GCodes
-    :param words: list of :class:`Word <pygcode.words.Word>` instances
+    :param words: list (or any iterable) of :class:`Word <pygcode.words.Word>` instances
     :type words: :class:`list`
     :return: tuple([<GCode>, <GCode>, ...], list(<unused words>))
     :rtype: :class:`tuple`
@@ -1482,47 +1583,35 @@ def words2gcodes(words):
     #
     # Conclusion: words are parameters first, gcodes second
 
-    # First determine which words are GCode candidates
-    word_info_list = [
-        {
-            'index': i, # for internal referencing
-            'word': word,
-            'gcode_class': word_gcode_class(word), # if not None, word is a candidate
-            'param_to_index': None,
-        }
-        for (i, word) in enumerate(words)
-    ]
-
-    # Link parameters to candidates
+    # Link parameters to candidates (in a single pass)
     # note: gcode candidates may be valid parameters... therefore
     # Also eliminate candidates that are parameters for earlier gcode candidates
-    for word_info in word_info_list:
-        if word_info['gcode_class'] is None:
-            continue # not a gcode candidate, so cannot have parameters
-        # which of the words following this gcode candidate are a valid parameter
-        for param_info in word_info_list[word_info['index'] + 1:]:
-            if param_info['word'].letter in word_info['gcode_class'].param_letters:
-                param_info['param_to_index'] = word_info['index']
-                param_info['gcode_class'] = None # no longer a valid candidate
-
-    # Map parameters
-    parameter_map = defaultdict(list) # {<gcode word index>: [<parameter words>], ... }
-    for word_info in word_info_list:
-        if word_info['gcode_class']:
-            continue # will form a gcode, so must not also be a parameter
-        parameter_map[word_info['param_to_index']].append(word_info['word'])
+    # A word is a parameter of the latest candidate before it accepting its letter
+    candidates = [] # [(<gcode class>, <gcode word>, [<parameter words>]), ... ] (so far), in order
+    unassigned_words = [] # neither gcodes, or gcode parameters (ie: modal parameters)
+    for word in words:
+        for (gcode_class, gcode_word, params) in reversed(candidates):
+            if word.letter in gcode_class.param_letters:
+                params.append(word)
+                break
+        else:
+            gcode_class = None # if not None, word is a candidate
+            if word.letter in _GCODE_WORD_LETTERS: # (short-circuit for parameters)
+                gcode_class = word_gcode_class(word)
+            if gcode_class is None:
+                unassigned_words.append(word)
+            else:
+                candidates.append((gcode_class, word, []))
 
     # Create gcode instances
-    for word_info in word_info_list:
-        if word_info['gcode_class'] is None:
-            continue # not a gcode candidate
-        gcode = word_info['gcode_class'](
-            word_info['word'],
-            *parameter_map[word_info['index']] # gcode parameters
+    for (gcode_class, gcode_word, params) in candidates:
+        gcode = gcode_class(
+            gcode_word,
+            *params # gcode parameters
         )
         gcodes.append(gcode)
 
-    return (gcodes, parameter_map[None])
+    return (gcodes, unassigned_words)
 
 
 def text2gcodes(text):
@@ -1531,8 +1620,7 @@ def text2gcodes(text):
     :param text: line from a g-code file
     :return: tuple([<GCode>, <GCode>, ...], list(<unused words>))
     """
-    words = list(text2words(text))
-    (gcodes, modal_words) = words2gcodes(words)
+    (gcodes, modal_words) = words2gcodes(text2words(text))
     if modal_words:
         raise GCodeWordStrError("gcode text not fully formed, unassigned parameters: %r" % modal_words)
     return gcodes
@@ -1540,6 +1628,10 @@ def text2gcodes(text):
 
 # ======================= Utilities =======================
 
+# Sort key for gcodes in execution order: sorted(gcode_list, key=_EXEC_ORDER_KEY)
+_EXEC_ORDER_KEY = attrgetter('exec_order')
+
+
 def split_gcodes(gcode_list, splitter_class, sort_list=True):
     """
     Splits a list of GCode instances into 3, the center list containing the splitter_class gcode
@@ -1590,7 +1682,7 @@ def split_gcodes(gcode_list, splitter_class, sort_list=True):
     # 3 lists are always returned, even if empty; if 2nd list is empty,
     # then the 3rd will be as well.
     if sort_list: # sort by execution order first
-        gcode_list = sorted(gcode_list)
+        gcode_list = sorted(gcode_list, key=_EXEC_ORDER_KEY)
 
     split = [gcode_list, [], []]  # default (if no splitter can be found)
 
@@ -1637,14 +1729,15 @@ def _gcodes_abs2rel(start_pos, dist_mode=None, axes='XYZ'):
     SUPPORTED_MOTIONS = (
         GCodeRapidMove, GCodeLinearMove,
     )
+    MOTION_MODAL_GROUP = MODAL_GROUP_MAP['motion']
 
     def wrapper(func):
 
         def inner(*largs, **kwargs):
             # Create Machine (with minimal information)
-            from .machine import Machine, Mode, Position
-            m = type('AbsoluteCoordMachine', (Machine,), {
-                'MODE_CLASS': type('NullMode', (Mode,), {'default_mode': 'G90'}),
+            machine = _machine_module()
+            m = type('AbsoluteCoordMachine', (machine.Machine,), {
+                'MODE_CLASS': type('NullMode', (machine.Mode,), {'default_mode': 'G90'}),
                 'axes': axes,
             })()
             m.pos = start_pos
@@ -1659,7 +1752,7 @@ def _gcodes_abs2rel(start_pos, dist_mode=None, axes='XYZ'):
                     m.process_gcodes(gcode)
                     pos_to = m.pos
 
-                    if gcode.modal_group != MODAL_GROUP_MAP['motion']:
+                    if gcode.modal_group != MOTION_MODAL_GROUP:
                         yield gcode  # only deal with motion gcodes
                         continue
                     elif not isinstance(gcode, SUPPORTED_MOTIONS):
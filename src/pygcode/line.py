@@ -4,6 +4,7 @@ from .comment import split_line
 from .block import Block
 
 class Line(object):
+    __slots__ = ('_text', 'block', 'comment', 'macro')
 
     line_regex = re.compile(r'^(?P<block_and_comment>.*?)?(?P<macro>%.*%?)?\s*$')
 
@@ -17,10 +18,14 @@ class Line(object):
 
         # Split line into block text, and comments
         if text is not None:
-            match = self.line_regex.search(text)
+            if '%' in text:
+                match = self.line_regex.search(text)
 
-            block_and_comment = match.group('block_and_comment')
-            self.macro = match.group('macro')
+                block_and_comment = match.group('block_and_comment')
+                self.macro = match.group('macro')
+            else:
+                # no macro (most lines), same as line_regex without a match
+                block_and_comment = text.rstrip()
 
             (block_str, comment) = split_line(block_and_comment)
             self.block = Block(block_str)
@@ -39,4 +44,7 @@ class Line(object):
         return self.block.gcodes
 
     def __str__(self):
+        if (self.comment is None) and (self.macro is None):
+            # block only (most lines)
+            return str(self.block) if self.block else ''
         return ' '.join([str(x) for x in [self.block, self.comment, self.macro] if x])
@@ -1,6 +1,5 @@
 import re
-from copy import copy, deepcopy
-from collections import defaultdict
+from copy import copy
 
 from .gcodes import (
     MODAL_GROUP_MAP, GCode,
@@ -9,7 +8,7 @@ from .gcodes import (
     GCodeIncrementalDistanceMode,
     GCodeUseInches, GCodeUseMillimeters,
     # Utilities
-    words2gcodes,
+    words2gcodes, _EXEC_ORDER_KEY,
 )
 from .block import Block
 from .line import Line
@@ -30,12 +29,31 @@ UNIT_MAP = {
         'conversion_factor': { UNIT_IMPERIAL: 1. / 25.4 },
     },
 }
+# flat conversion factor lookup: {(<from unit>, <to unit>): <factor>, ...}
+_UNIT_FACTOR = dict(((unit, unit), 1.0) for unit in UNIT_MAP)
+_UNIT_FACTOR.update(
+    ((from_unit, to_unit), factor)
+    for (from_unit, unit_info) in UNIT_MAP.items()
+    for (to_unit, factor) in unit_info['conversion_factor'].items()
+)
+
+# Position axes sets (interned, so positions with the same axes share one frozenset)
+_AXES_INTERN = {}
+_SORTED_AXES = {}  # {<axes frozenset>: <tuple of sorted axes>, ...}
+
+# Modal groups, in the order they're listed by Mode.gcodes
+_SORTED_MODAL_GROUPS = tuple(sorted(MODAL_GROUP_MAP.values()))
+
+# (sets a Position's slots, bypassing Position.__setattr__)
+_object_setattr = object.__setattr__
 
 
 class Position(object):
+    __slots__ = ('axes', '_unit', '_value')
+
     default_axes = 'XYZABCUVW'
     default_unit = UNIT_METRIC
-    POSSIBLE_AXES = set('XYZABCUVW')
+    POSSIBLE_AXES = frozenset('XYZABCUVW')
 
     def __init__(self, axes=None, **kwargs):
         # Set axes (note: usage in __getattr__ and __setattr__)
@@ -45,21 +63,63 @@ class Position(object):
             invalid_axes = set(axes) - self.POSSIBLE_AXES
             if invalid_axes:
                 raise MachineInvalidAxis("invalid axes proposed %s" % invalid_axes)
-        self.__dict__['axes'] = set(axes) & self.POSSIBLE_AXES
+        axes = frozenset(axes) & self.POSSIBLE_AXES
+        object.__setattr__(self, 'axes', _AXES_INTERN.setdefault(axes, axes))  # shared
 
         # Unit
         self._unit = kwargs.pop('unit', self.default_unit)
 
         # Initial Values
-        self._value = defaultdict(lambda: 0.0, dict((k, 0.0) for k in self.axes))
-        self._value.update(kwargs)
+        #   (a value per axis; fixed layout, so no defaultdict fallback is needed)
+        self._value = dict.fromkeys(self.axes, 0.0)
+        if kwargs.keys() <= self.axes:
+            self._value.update(kwargs)
+        else:
+            # values for undefined axes are ignored
+            self._value.update((k, v) for (k, v) in kwargs.items() if k in self.axes)
+
+    def _new_with(self, values):
+        """
+        Create a new instance like self, with the given values, without going
+        through __init__ (axes are never mutated, so they're shared)
+        :param values: dict of values for each of self.axes (not copied)
+        :return: new instance of the same class
+        """
+        obj = object.__new__(self.__class__)
+        _object_setattr(obj, 'axes', self.axes)
+        _object_setattr(obj, '_unit', self._unit)
+        _object_setattr(obj, '_value', values)
+        return obj
+
+    def _fast_new(self):
+        """
+        Create a copy of self without going through __init__
+        :return: new instance of the same class, with the same values
+        """
+        return self._new_with(self._value.copy())
 
     def __copy__(self):
-        return self.__class__(axes=copy(self.axes), unit=self._unit, **self.values)
+        return self._fast_new()
 
     def update(self, **coords):
+        (axes, value) = (self.axes, self._value)
         for (k, v) in coords.items():
-            setattr(self, k, v)
+            if k in axes:
+                value[k] = v
+            else:
+                setattr(self, k, v)  # raises for undefined axes
+
+    # Items Get/Set (eg: pos['X'], without the attribute lookup protocol)
+    def __getitem__(self, key):
+        if key in self.axes:
+            return self._value[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.axes:
+            self._value[key] = value
+        else:
+            raise MachineInvalidAxis("'%s' axis is not defined to be set" % key)
 
     # Attributes Get/Set
     def __getattr__(self, key):
@@ -77,54 +137,86 @@ class Position(object):
         elif key in self.POSSIBLE_AXES:
             raise MachineInvalidAxis("'%s' axis is not defined to be set" % key)
         else:
-            self.__dict__[key] = value
+            super(Position, self).__setattr__(key, value)  # (honours the unit property)
 
     # Equality
     def __eq__(self, other):
+        if self is other:
+            return True
+        if self.axes is other.axes and self._unit == other._unit:
+            return self._value == other._value  # common case: same axes & unit
         if self.axes ^ other.axes:
             return False
         else:
             if self._unit == other._unit:
                 return self._value == other._value
             else:
-                x = copy(other)
-                x.unit = self._unit
-                return self._value == x._value
+                # compare with other's values converted in-line (stops at first mismatch)
+                factor = _UNIT_FACTOR[(other._unit, self._unit)]
+                other_value = other._value
+                return all(
+                    v == (other_value[k] if other_value[k] is None else other_value[k] * factor)
+                    for (k, v) in self._value.items()
+                )
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     # Arithmetic
     def __add__(self, other):
-        if self.axes ^ other.axes:
+        if (self.axes is not other.axes) and (self.axes ^ other.axes):
             raise MachineInvalidAxis("axes: %r != %r" % (self.axes, other.axes))
-        new_obj = copy(self)
-        for k in new_obj._value:
-            new_obj._value[k] += other._value[k]
-        return new_obj
+        other_value = other._value
+        return self._new_with(dict((k, v + other_value[k]) for (k, v) in self._value.items()))
 
     def __sub__(self, other):
-        if other.axes - self.axes:
+        if (other.axes is not self.axes) and (other.axes - self.axes):
             raise MachineInvalidAxis("for a - b: axes in b, that are not in a: %r" % (other.axes - self.axes))
-        new_obj = copy(self)
+        new_obj = self._fast_new()
         for k in other._value:
             new_obj._value[k] -= other._value[k]
         return new_obj
 
     def __mul__(self, scalar):
-        new_obj = copy(self)
-        for k in self._value:
-            new_obj._value[k] = self._value[k] * scalar
-        return new_obj
+        return self._new_with(dict((k, v * scalar) for (k, v) in self._value.items()))
 
     def __div__(self, scalar):
-        new_obj = copy(self)
-        for k in self._value:
-            new_obj._value[k] = self._value[k] / scalar
-        return new_obj
+        return self._new_with(dict((k, v / scalar) for (k, v) in self._value.items()))
 
     __truediv__ = __div__ # Python 3 division
 
+    def _add_offsets(self, *offsets):
+        """
+        Equivalent to self + offsets[0] + offsets[1] + ...
+        without creating intermediate instances
+        :param offsets: Position instances to add
+        :return: new Position instance
+        """
+        new_obj = self._fast_new()
+        value = new_obj._value
+        for other in offsets:
+            if (self.axes is not other.axes) and (self.axes ^ other.axes):
+                raise MachineInvalidAxis("axes: %r != %r" % (self.axes, other.axes))
+            for (k, v) in other._value.items():
+                value[k] += v
+        return new_obj
+
+    def _sub_offsets(self, *offsets):
+        """
+        Equivalent to self - offsets[0] - offsets[1] - ...
+        without creating intermediate instances
+        :param offsets: Position instances to subtract
+        :return: new Position instance
+        """
+        new_obj = self._fast_new()
+        value = new_obj._value
+        for other in offsets:
+            if (other.axes is not self.axes) and (other.axes - self.axes):
+                raise MachineInvalidAxis("for a - b: axes in b, that are not in a: %r" % (other.axes - self.axes))
+            for (k, v) in other._value.items():
+                value[k] -= v
+        return new_obj
+
     # Conversion
     @property
     def unit(self):
@@ -133,9 +225,10 @@ class Position(object):
     @unit.setter
     def unit(self, value):
         if value != self._unit:
-            factor = UNIT_MAP[self._unit]['conversion_factor'][value]
-            for k in [k for (k, v) in self._value.items() if v is not None]:
-                self._value[k] *= factor
+            factor = _UNIT_FACTOR[(self._unit, value)]
+            for (k, v) in self._value.items():
+                if v is not None:
+                    self._value[k] = v * factor
             self._unit = value
 
     # Min/Max
@@ -149,15 +242,14 @@ class Position(object):
         :param p2: Position instance
         :return: Position instance with the highest/lowest value per axis
         """
-        if p2.unit != p1.unit:
-            p2 = copy(p2)
-            p2.unit = p1.unit
-        return cls(
-            unit=p1.unit,
-            **dict(
-                (k, key(getattr(p1, k), getattr(p2, k))) for k in p1.values
-            )
-        )
+        p2_value = p2._value
+        if p2._unit == p1._unit:
+            values = dict((k, key(v, p2_value[k])) for (k, v) in p1._value.items())
+        else:
+            # convert p2's values in-line (instead of converting a copy of p2)
+            factor = _UNIT_FACTOR[(p2._unit, p1._unit)]
+            values = dict((k, key(v, p2_value[k] * factor)) for (k, v) in p1._value.items())
+        return cls(unit=p1._unit, **values)
 
     @classmethod
     def min(cls, a, b):
@@ -170,7 +262,10 @@ class Position(object):
     # Words & Values
     @property
     def words(self):
-        return sorted(Word(k, self._value[k]) for k in self.axes)
+        axes = _SORTED_AXES.get(self.axes)
+        if axes is None:
+            axes = _SORTED_AXES[self.axes] = tuple(sorted(self.axes))
+        return [Word(k, self._value[k]) for k in axes]
 
     @property
     def values(self):
@@ -178,7 +273,7 @@ class Position(object):
 
     @property
     def vector(self):
-        return Vector3(self._value['X'], self._value['Y'], self._value['Z'])
+        return Vector3(*(self._value.get(k, 0.0) for k in 'XYZ'))
 
     # String representation(s)
     def __repr__(self):
@@ -261,6 +356,16 @@ class State(object):
         )
 
 
+def _gcode_copy(gcode):
+    """
+    Copy of the given gcode, including copies of its words
+    (unlike GCode.modal_copy, the copy shares no words with the original)
+    :param gcode: GCode instance
+    :return: GCode instance
+    """
+    return gcode.__class__(copy(gcode.word), *[copy(w) for w in gcode.params.values()])
+
+
 class Mode(object):
     """Machine's mode"""
     # Default Mode
@@ -290,18 +395,34 @@ class Mode(object):
     # Mode is defined by gcodes set by processed blocks:
     #   see modal_group in gcode.py module for details
     def __init__(self, set_default=True):
-        self.modal_groups = defaultdict(lambda: None)
+        self.modal_groups = dict.fromkeys(_SORTED_MODAL_GROUPS, None)
 
         # Initialize (from multiline self.default_mode)
         if set_default:
+            # gcodes (and their words) are copied; mode instances share nothing
+            self.set_mode(*[_gcode_copy(g) for g in self._default_gcodes()])
+
+    @classmethod
+    def _default_gcodes(cls):
+        """
+        Parsed gcodes of cls.default_mode (parsed once per class)
+        note: these instances are shared, they must be copied (with their
+        words) before being used as a mode
+        :return: tuple of GCode instances
+        """
+        if '_default_gcode_cache' not in cls.__dict__:
             gcodes = []
-            for m in re.finditer(r'\s*(?P<line>.*)\s*\n?', self.default_mode):
+            for m in re.finditer(r'\s*(?P<line>.*)\s*\n?', cls.default_mode):
                 gcodes += Line(m.group('line')).block.gcodes
-            self.set_mode(*gcodes)
+            cls._default_gcode_cache = tuple(gcodes)
+        return cls._default_gcode_cache
 
     def __copy__(self):
         obj = self.__class__(set_default=False)
-        obj.modal_groups = deepcopy(self.modal_groups)
+        obj.modal_groups = dict(
+            (k, None if g is None else _gcode_copy(g))
+            for (k, g) in self.modal_groups.items()
+        )
         return obj
 
     def set_mode(self, *gcode_list):
@@ -311,46 +432,21 @@ class Mode(object):
         :return: dict of form: {<modal group>: <new mode GCode>, ...}
         """
         modal_gcodes = {}
-        for g in sorted(gcode_list): # sorted by execution order
+        for g in gcode_list:
+            # order is irrelevant; assumption: no 2 gcodes are in the same modal_group
             if g.modal_group is not None:
                 self.modal_groups[g.modal_group] = g.modal_copy()
                 modal_gcodes[g.modal_group] = self.modal_groups[g.modal_group]
-                # assumption: no 2 gcodes are in the same modal_group
         return modal_gcodes
 
-    def __getattr__(self, key):
-        if key in MODAL_GROUP_MAP:
-            return self.modal_groups[MODAL_GROUP_MAP[key]]
-
-        raise AttributeError("'{cls}' object has no attribute '{key}'".format(
-            cls=self.__class__.__name__,
-            key=key
-        ))
-
-    def __setattr__(self, key, value):
-        if key in MODAL_GROUP_MAP:
-            # Set/Clear modal group gcode
-            if value is None:
-                # clear mode group
-                self.modal_groups[MODAL_GROUP_MAP[key]] = None
-            else:
-                # set mode group explicitly, not advisable
-                # (recommended to use self.set_mode(value) instead)
-                if not isinstance(value, GCode):
-                    raise MachineInvalidState("invalid mode value: %r" % value)
-                if value.modal_group != MODAL_GROUP_MAP[key]:
-                    raise MachineInvalidState("cannot set '%s' mode as %r, wrong group" % (key, value))
-                self.modal_groups[MODAL_GROUP_MAP[key]] = value.modal_copy()
-        else:
-            self.__dict__[key] = value
-
     @property
     def gcodes(self):
         """List of modal gcodes"""
         gcode_list = []
-        for modal_group in sorted(MODAL_GROUP_MAP.values()):
-            if self.modal_groups[modal_group]:
-                gcode_list.append(self.modal_groups[modal_group])
+        for modal_group in _SORTED_MODAL_GROUPS:
+            gcode = self.modal_groups[modal_group]
+            if gcode:
+                gcode_list.append(gcode)
         return gcode_list
 
     def __str__(self):
@@ -362,6 +458,61 @@ class Mode(object):
         )
 
 
+def _modal_group_property(key):
+    """
+    Property to get/set a Mode's gcode for the named modal group
+    (the modal group is resolved once, here, instead of on every access)
+    :param key: name of modal group, a key of MODAL_GROUP_MAP
+    :return: property instance
+    """
+    modal_group = MODAL_GROUP_MAP[key]
+
+    def getter(self):
+        return self.modal_groups[modal_group]
+
+    def setter(self, value):
+        # Set/Clear modal group gcode
+        if value is None:
+            # clear mode group
+            self.modal_groups[modal_group] = None
+        else:
+            # set mode group explicitly, not advisable
+            # (recommended to use self.set_mode(value) instead)
+            if not isinstance(value, GCode):
+                raise MachineInvalidState("invalid mode value: %r" % value)
+            if value.modal_group != modal_group:
+                raise MachineInvalidState("cannot set '%s' mode as %r, wrong group" % (key, value))
+            self.modal_groups[modal_group] = value.modal_copy()
+
+    return property(getter, setter)
+
+# Mode attributes for each modal group (eg: mode.motion, mode.units, etc)
+for _key in MODAL_GROUP_MAP:
+    setattr(Mode, _key, _modal_group_property(_key))
+del _key
+
+
+# Position subclasses, shared by machines with the same axes & unit
+_POSITION_CLASS_CACHE = {}  # {(<axes frozenset>, <unit>): <Position subclass>, ...}
+
+def _position_class(axes, unit):
+    """
+    Position subclass with the given default axes & unit
+    :param axes: iterable of axes (eg: 'XYZ')
+    :param unit: unit id (eg: UNIT_METRIC)
+    :return: Position subclass
+    """
+    key = (frozenset(axes), unit)
+    cls = _POSITION_CLASS_CACHE.get(key)
+    if cls is None:
+        cls = _POSITION_CLASS_CACHE[key] = type('Position', (Position,), {
+            '__slots__': (),
+            'default_axes': key[0],
+            'default_unit': unit,
+        })
+    return cls
+
+
 class Machine(object):
     """Machine to process gcodes, enforce axis limits, keep track of time, etc"""
 
@@ -378,13 +529,15 @@ class Machine(object):
 
         # Position type (with default axes the same as this machine)
         units_mode = getattr(self.mode, 'units', None)
-        self.Position = type('Position', (Position,), {
-            'default_axes': self.axes,
-            'default_unit': units_mode.unit_id if units_mode else Position.default_unit,
-        })
+        self.Position = _position_class(
+            axes=self.axes,
+            unit=units_mode.unit_id if units_mode else Position.default_unit,
+        )
 
         # Absolute machine position
         self.abs_pos = self.Position()
+        # Zero offset (used when no coordinate system is selected)
+        self._zero_pos = Position(axes=self.axes)
         # Machine's motion range (min/max corners of a bounding box)
         self.abs_range_min = copy(self.abs_pos)
         self.abs_range_max = copy(self.abs_pos)
@@ -420,11 +573,12 @@ class Machine(object):
             (modal_gcodes, unasigned_words) = ([], modal_params)
             # forces exception to be raised in next step
         else:
-            params = copy(self.mode.motion.params)  # dict
-            params.update(dict((w.letter, w) for w in modal_params))  # override retained modal parameters
-            (modal_gcodes, unasigned_words) = words2gcodes(
-                [self.mode.motion.word] + list(params.values())
-            )
+            motion = self.mode.motion
+            modal_words = dict((w.letter, w) for w in modal_params)
+            words = [motion.word]
+            words += (w for (k, w) in motion.params.items() if k not in modal_words)  # retained modal parameters
+            words += modal_words.values()  # (override retained modal parameters)
+            (modal_gcodes, unasigned_words) = words2gcodes(words)
 
         if unasigned_words and (not self.ignore_invalid_modal):
             # Can't process with unknown words on the same line...
@@ -461,7 +615,7 @@ class Machine(object):
         modal_gcode = self.modal_gcode(block.modal_params)
         if modal_gcode:
             gcodes.append(modal_gcode)
-        return sorted(gcodes)
+        return sorted(gcodes, key=_EXEC_ORDER_KEY)
 
     def clean_block(self, block):
         """
@@ -496,7 +650,7 @@ class Machine(object):
             if modal_gcode:
                 gcode_list.append(modal_gcode)
 
-        for gcode in sorted(gcode_list):
+        for gcode in sorted(gcode_list, key=_EXEC_ORDER_KEY):
             gcode.process(self) # shifts ownership of what happens now to GCode class
 
             # TODO: gcode instance to change machine's state
@@ -520,15 +674,17 @@ class Machine(object):
     # Position conversions (considering offsets)
     def abs2work(self, abs_pos):
         assert isinstance(abs_pos, Position), "bad abs_pos type"
-        coord_sys_offset = getattr(self.state.coord_sys, 'offset', Position(axes=self.axes))
+        coord_sys = self.state.coord_sys
+        coord_sys_offset = coord_sys.offset if coord_sys is not None else self._zero_pos
         temp_offset = self.state.offset
-        return (abs_pos - coord_sys_offset) - temp_offset
+        return abs_pos._sub_offsets(coord_sys_offset, temp_offset)
 
     def work2abs(self, work_pos):
         assert isinstance(work_pos, Position), "bad work_pos type"
-        coord_sys_offset = getattr(self.state.coord_sys, 'offset', Position(axes=self.axes))
+        coord_sys = self.state.coord_sys
+        coord_sys_offset = coord_sys.offset if coord_sys is not None else self._zero_pos
         temp_offset = self.state.offset
-        return (work_pos + temp_offset + coord_sys_offset)
+        return work_pos._add_offsets(temp_offset, coord_sys_offset)
 
     @property
     def pos(self):
@@ -542,8 +698,18 @@ class Machine(object):
         self._update_abs_range(self.abs_pos)
 
     def _update_abs_range(self, pos):
-        self.abs_range_min = Position.min(pos, self.abs_range_min)
-        self.abs_range_max = Position.max(pos, self.abs_range_max)
+        # expand range in-place (equivalent to Position.min & Position.max,
+        # without creating new Position instances)
+        (range_min, range_max) = (self.abs_range_min, self.abs_range_max)
+        if pos._unit != range_min._unit:
+            pos = copy(pos)
+            pos.unit = range_min._unit
+        (min_value, max_value) = (range_min._value, range_max._value)
+        for (k, v) in pos._value.items():
+            if v < min_value[k]:
+                min_value[k] = v
+            if v > max_value[k]:
+                max_value[k] = v
 
     # =================== Machine Actions ===================
     def move_to(self, rapid=False, **coords):
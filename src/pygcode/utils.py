@@ -71,23 +71,23 @@ def omit_redundant_modes(gcode_iter):
     :param gcode_iter: iterable to return with modifications
     """
 
-    from .machine import Machine, Mode
-    from .gcodes import MODAL_GROUP_MAP
-    class NullModeMachine(Machine):
-        MODE_CLASS = type('NullMode', (Mode,), {'default_mode': ''})
-    m = NullModeMachine()
+    # (imported here: gcodes module imports this one)
+    from .gcodes import MODAL_GROUP_MAP, GCodeCancelCannedCycle
+    motion_group = MODAL_GROUP_MAP['motion']
+
+    # Only the motion mode is ever omitted, so only the current motion mode's
+    # word is tracked (rather than processing each gcode with a whole Machine)
+    motion_word = None
 
     for g in gcode_iter:
-        if (g.modal_group is not None) and (m.mode.modal_groups[g.modal_group] is not None):
-            # g-code has a modal groups, and the machine's mode
-            # (of the same modal group) is not None
-            if m.mode.modal_groups[g.modal_group].word == g.word:
-                # machine's mode & g-code's mode match (no machine change)
-                if g.modal_group == MODAL_GROUP_MAP['motion']:
-                    # finally: g-code sets a motion mode in the machine
-                    g = copy(g) # duplicate gcode object
-                    # stop redundant g-code word from being printed
-                    g._whitespace_prefix = True
+        if g.modal_group == motion_group:
+            if (motion_word is not None) and (motion_word == g.word):
+                # g-code sets the motion mode the machine is already in
+                g = copy(g) # duplicate gcode object
+                # stop redundant g-code word from being printed
+                g._whitespace_prefix = True
+            motion_word = g.word
+        elif isinstance(g, GCodeCancelCannedCycle):
+            motion_word = None  # G80: leaves machine with no motion mode
 
-        m.process_gcodes(g)
         yield g
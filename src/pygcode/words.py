@@ -1,35 +1,47 @@
 import re
 import itertools
-import six
 
 from . import dialects
 from .exceptions import GCodeBlockFormatError, GCodeWordStrError
 
-class Word(object):
-    def __init__(self, *args, **kwargs):
-        # Parameters (listed)
-        args_count = len(args)
-        if args_count == 1:
-            # Word('G90')
-            letter = args[0][0] # first letter
-            value = args[0][1:] # rest of string
-        elif args_count == 2:
-            # Word('G', 90)
-            (letter, value) = args
-        else:
-            raise AssertionError("input arguments either: (letter, value) or (word_str)")
+# Word type details, per dialect & letter
+_WORD_SPEC_CACHE = {}  # {(<dialect name>, <letter>): (<letter>, <word map>, <value class>, <clean function>), ...}
 
-        # Parameters (keyword)
-        dialect = kwargs.pop('dialect', dialects.get_default())
+def _word_spec(dialect, letter):
+    """
+    Resolve the word map, value class, and clean function for a word's letter
+    :param dialect: name of dialect (if None, the default dialect is used)
+    :param letter: word letter (either case)
+    :return: tuple of the form: (<upper case letter>, <word map>, <value class>, <clean function>)
+    """
+    key = (dialect or dialects.get_default(), letter)
+    spec = _WORD_SPEC_CACHE.get(key)
+    if spec is None:
+        word_map = dialects._resolve(key[0]).WORD_MAP
+        upper_letter = letter.upper()
+        word_type = word_map[upper_letter]  # KeyError for unknown letters
+        spec = _WORD_SPEC_CACHE[key] = (upper_letter, word_map, word_type.cls, word_type.clean_value)
+    return spec
 
-        letter = letter.upper()
 
-        self._word_map = getattr(getattr(dialects, dialect), 'WORD_MAP')
-        self._value_class = self._word_map[letter].cls
-        self._value_clean = self._word_map[letter].clean_value
+class Word(object):
+    __slots__ = ('_letter', '_value', '_word_map', '_value_class', '_value_clean', '_value_str', '_key', '_hash')
 
-        self.letter = letter
-        self.value = value
+    def __init__(self, letter, value=None, dialect=None):
+        # Parameters: either (letter, value) or (word_str)
+        if value is None:
+            # Word('G90')
+            (letter, value) = (letter[0], letter[1:]) # (first letter, rest of string)
+        # else: Word('G', 90)
+
+        # (upper case letter is resolved with, and cached alongside, the word's type)
+        (letter, self._word_map, self._value_class, self._value_clean) = _word_spec(dialect, letter)
+
+        self._letter = letter
+        self._value = self._value_class(value)
+        self._value_str = None  # (cached by value_str)
+        self._key = (letter, self._value)  # for sorting & hashing
+        self._hash = None  # (cached by __hash__)
 
     def __str__(self):
         return "{letter}{value}".format(
@@ -45,34 +57,58 @@ class Word(object):
 
     # Sorting
     def __lt__(self, other):
-        return (self.letter, self.value) < (other.letter, other.value)
+        return self._key < other._key
 
     def __gt__(self, other):
-        return (self.letter, self.value) > (other.letter, other.value)
+        return self._key > other._key
 
     def __le__(self, other):
-        return (self.letter, self.value) <= (other.letter, other.value)
+        return self._key <= other._key
 
     def __ge__(self, other):
-        return (self.letter, self.value) >= (other.letter, other.value)
+        return self._key >= other._key
 
     # Equality
     def __eq__(self, other):
-        if isinstance(other, six.string_types):
-            other = str2word(other)
-        return (self.letter == other.letter) and (self.value == other.value)
+        if isinstance(other, str):
+            other = _comparison_word(other)
+        return (self.letter == other.letter) and (self._value == other._value)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     # Hashing
     def __hash__(self):
-        return hash((self.letter, self.value))
+        if self._hash is None:
+            self._hash = hash(self._key)
+        return self._hash
+
+    # Copying
+    def __copy__(self):
+        # shallow copy, without Word.__init__ re-parsing the value (or the
+        # copy module's generic __reduce_ex__ round-trip)
+        word = self.__class__.__new__(self.__class__)
+        for attr in Word.__slots__:
+            setattr(word, attr, getattr(self, attr))
+        return word
 
     @property
     def value_str(self):
         """Clean string representation, for consistent file output"""
-        return self._value_clean(self.value)
+        if self._value_str is None:
+            self._value_str = self._value_clean(self._value)
+        return self._value_str
+
+    # Letter Property
+    @property
+    def letter(self):
+        return self._letter
+
+    @letter.setter
+    def letter(self, new_letter):
+        self._letter = new_letter
+        self._key = (new_letter, self._value)
+        self._hash = None
 
     # Value Properties
     @property
@@ -82,47 +118,36 @@ class Word(object):
     @value.setter
     def value(self, new_value):
         self._value = self._value_class(new_value)
+        self._value_str = None
+        self._key = (self._letter, self._value)
+        self._hash = None
 
     @property
     def description(self):
         return "%s: %s" % (self.letter, self._word_map[self.letter].description)
 
 
+_NON_WHITESPACE = re.compile(r'\S')
+
 def text2words(block_text, dialect=None):
     """
     Iterate through block text yielding Word instances
     :param block_text: text for given block with comments removed
     """
-    if dialect is None:
-        dialect = dialects.get_default()
-    word_map = getattr(getattr(dialects, dialect), 'WORD_MAP')
-
-    next_word = re.compile(r'^.*?(?P<letter>[%s])' % ''.join(word_map.keys()), re.IGNORECASE)
+    scanner = dialects._resolve(dialect).WORD_SCANNER
 
     index = 0
-    while True:
-        letter_match = next_word.search(block_text[index:])
-        if letter_match:
-            # Letter
-            letter = letter_match.group('letter').upper()
-            index += letter_match.end() # propogate index to start of value
+    for match in scanner.finditer(block_text):
+        letter = match.lastgroup  # upper case letter (see word_scanner)
+        if letter == '_invalid':
+            raise GCodeWordStrError("word '%s' value invalid" % match.group(letter).upper())
 
-            # Value
-            value_regex = word_map[letter].value_regex
-            value_match = value_regex.search(block_text[index:])
-            if value_match is None:
-                raise GCodeWordStrError("word '%s' value invalid" % letter)
-            value = value_match.group() # matched text
+        yield Word(letter, match.group(letter))
 
-            yield Word(letter, value)
+        index = match.end() # propogate index to end of value
 
-            index += value_match.end() # propogate index to end of value
-        else:
-            break
-
-    remainder = block_text[index:]
-    if remainder and re.search(r'\S', remainder):
-        raise GCodeWordStrError("block code remaining '%s'" % remainder)
+    if _NON_WHITESPACE.search(block_text, index):
+        raise GCodeWordStrError("block code remaining '%s'" % block_text[index:])
 
 
 def str2word(word_str):
@@ -134,6 +159,24 @@ def str2word(word_str):
     return None
 
 
+# Words parsed from strings for Word.__eq__ (never returned to the caller, so
+# sharing them is safe, even though Word instances are mutable)
+_COMPARISON_WORD_CACHE = {}  # {(<dialect name>, <word str>): <Word>, ...}
+_COMPARISON_WORD_CACHE_SIZE = 1024
+
+def _comparison_word(word_str):
+    key = (dialects.get_default(), word_str)
+    try:
+        return _COMPARISON_WORD_CACHE[key]
+    except KeyError:
+        pass
+    word = str2word(word_str)
+    if len(_COMPARISON_WORD_CACHE) >= _COMPARISON_WORD_CACHE_SIZE:
+        _COMPARISON_WORD_CACHE.clear()  # (rare; compared strings are typically literals)
+    _COMPARISON_WORD_CACHE[key] = word
+    return word
+
+
 def words2dict(word_list, limit_word_letters=None):
     """
     Represent a list of words as a dict
@@ -141,7 +184,10 @@ def words2dict(word_list, limit_word_letters=None):
     :return: dict of the form: {<letter>: <value>, ... }
     """
     # Remember: duplicate word letters cannot be represented as a dict
+    if limit_word_letters is None:
+        return dict((w.letter, w._value) for w in word_list)
+    limit_word_letters = frozenset(limit_word_letters)
     return dict(
-        (w.letter, w.value) for w in word_list
-        if (limit_word_letters is None) or (w.letter in limit_word_letters)
+        (w.letter, w._value) for w in word_list
+        if w.letter in limit_word_letters
     )
@@ -13,7 +13,7 @@ from pygcode import gcodes
 from pygcode import words
 from pygcode import machine
 
-from pygcode.exceptions import GCodeWordStrError
+from pygcode.exceptions import GCodeWordStrError, GCodeParameterError
 
 class GCodeWordMappingTests(unittest.TestCase):
     def test_word_map_integrity(self):
@@ -27,6 +27,45 @@ class GCodeWordMappingTests(unittest.TestCase):
                     word_maches(word),
                     "conflict with %s and %s" % (fn_class, key_class)
                 )
+        for (letter, letter_class) in gcodes._gcode_letter_map.items():
+            for (word, key_class) in gcodes._gcode_word_map.items():
+                # Verify that no mapped word uses a letter mapped as a whole
+                self.assertNotEqual(
+                    word.letter, letter,
+                    "conflict with %s and %s" % (letter_class, key_class)
+                )
+
+    def test_subclass_word_key(self):
+        # subclasses inheriting a word_key are not registered
+        class MyRapidMove(gcodes.GCodeRapidMove):
+            pass
+        self.assertIs(
+            gcodes.word_gcode_class(words.Word('G', 0)),
+            gcodes.GCodeRapidMove
+        )
+        self.assertEqual(str(MyRapidMove(X=1)), 'G00 X1')
+
+    def test_subclass_word_key_candidates(self):
+        class MyGotoPredefinedPosition(gcodes.GCodeGotoPredefinedPosition):
+            pass
+        self.assertIs(
+            gcodes.word_gcode_class(words.Word('G', 30)),
+            gcodes.GCodeGotoPredefinedPosition
+        )
+
+    def test_subclass_word_letter_match(self):
+        class MyFeedRate(gcodes.GCodeFeedRate):
+            pass
+        self.assertIs(
+            gcodes.word_gcode_class(words.Word('F', 100)),
+            gcodes.GCodeFeedRate
+        )
+        self.assertEqual(MyFeedRate(100).word, words.Word('F', 100))
+
+    def test_exhaustive_parameters_not_cached(self):
+        self.assertIsNone(gcodes.word_gcode_class(words.Word('X', 1.2345), exhaustive=True))
+        self.assertNotIn(('X', 1.2345), gcodes._gcode_class_cache)
+
 
 class GCodeModalGroupTests(unittest.TestCase):
     def test_modal_groups(self):
@@ -105,6 +144,17 @@ class Words2GCodesTests(unittest.TestCase):
         self.assertEqual(gcode_list[1].word, words.Word('F', 1500))
 
 
+class GCodeAssertParamsTests(unittest.TestCase):
+    def test_arc_params(self):
+        # valid
+        for text in ['G2 X1 I1', 'G3 X1 Y2 R3', 'G2 Z1 J-1 K2']:
+            gcodes.text2gcodes(text)[0].assert_params()
+        # invalid
+        for text in ['G2 I1', 'G2 X1', 'G2 X1 I1 R1', 'G3 X1 R0']:
+            g = gcodes.text2gcodes(text)[0]
+            self.assertRaises(GCodeParameterError, g.assert_params)
+
+
 class Text2GCodesTests(unittest.TestCase):
     def test_basic(self):
         gcs = gcodes.text2gcodes('G1 X1 Y2 G90')
@@ -121,6 +171,17 @@ class Text2GCodesTests(unittest.TestCase):
             gcodes.text2gcodes('X1 Y2')
 
 
+class GCodeStrTests(unittest.TestCase):
+    def test_whitespace_prefix(self):
+        g = gcodes.GCodeLinearMove(X=1)
+        g._whitespace_prefix = True
+        self.assertEqual(str(g), '    X1')
+        g.word = words.Word('G', 100)  # prefix is padded to the current word
+        self.assertEqual(str(g), '     X1')
+        g._whitespace_prefix = False
+        self.assertEqual(str(g), 'G100 X1')
+
+
 class GCodeSplitTests(unittest.TestCase):
 
     def test_split(self):
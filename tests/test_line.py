@@ -1,3 +1,4 @@
+import re
 import unittest
 
 # Add relative pygcode to path
@@ -6,6 +7,9 @@ add_pygcode_to_path()
 
 # Units under test
 from pygcode.line import Line
+from pygcode.block import Block
+from pygcode import comment
+from pygcode import words
 
 
 class LineCommentTests(unittest.TestCase):
@@ -24,6 +28,18 @@ class LineCommentTests(unittest.TestCase):
         self.assertEqual(line.comment.text, 'x coord. y coord. eol')
         self.assertEqual(len(line.block.words), 6)
 
+    def test_line_comment_subclass(self):
+        # comment classes are auto-detected once defined
+        class CommentAt(comment.CommentBase):
+            ORDER = 3
+            AUTO_REGEX = re.compile(r'\s*@\s*(?P<text>.*)$')
+        self.addCleanup(comment._COMMENT_CLASSES.remove, CommentAt)
+
+        line = Line('G02 X10.75 Y47.44 I-0.11 J-1.26 F70 @ blah blah')
+        self.assertIsInstance(line.comment, CommentAt)
+        self.assertEqual(line.comment.text, 'blah blah')
+        self.assertEqual(len(line.block.words), 6)
+
     def test_line_macros(self):
         # (blank)
         line = Line('')
@@ -49,3 +65,22 @@ class LineCommentTests(unittest.TestCase):
         line = Line('G02 X10.75 Y2 ; abc %something%')
         self.assertEqual(line.comment.text.strip(), 'abc')
         self.assertEqual(line.macro, '%something%')
+
+
+class BlockTests(unittest.TestCase):
+    def test_word_attributes(self):
+        block = Block('G1 X1 Y2 M3')
+        self.assertEqual(block.X, words.Word('X', 1))
+        self.assertEqual(block.M, words.Word('M', 3))
+        self.assertIsNone(block.Z)  # valid letter, not in block
+        self.assertIsNone(Block().X)
+        with self.assertRaises(AttributeError):
+            block.not_a_word
+
+    def test_word_attributes_after_change(self):
+        block = Block('G1 X1')
+        self.assertEqual(block.X, words.Word('X', 1))
+        block.words.append(words.Word('Y', 2))
+        block.words[1] = words.Word('X', 5)
+        self.assertEqual(block.X, words.Word('X', 5))
+        self.assertEqual(block.Y, words.Word('Y', 2))
@@ -1,11 +1,12 @@
 import unittest
+from copy import copy
 
 # Add relative pygcode to path
 from testutils import add_pygcode_to_path, str_lines
 add_pygcode_to_path()
 
 # Units under test
-from pygcode.machine import Position, Machine
+from pygcode.machine import Position, Machine, UNIT_IMPERIAL, UNIT_METRIC
 from pygcode.line import Line
 from pygcode.exceptions import MachineInvalidAxis
 from pygcode.gcodes import (
@@ -20,22 +21,39 @@ class PositionTests(unittest.TestCase):
         p = Position()
         #
 
+    def test_undefined_axis_values(self):
+        # values given for undefined axes are ignored
+        p = Position(axes='XY', X=1, Z=2)
+        self.assertEqual(p.axes, frozenset('XY'))
+        self.assertEqual(p.values, {'X': 1, 'Y': 0.0})
+
     def test_default_axes(self):
         p = Position()  # no instantiation parameters
         # all initialized to zero
         for axis in 'XYZABCUVW':
             self.assertEqual(getattr(p, axis), 0)
 
+        other_axes = dict((a, frozenset('XYZABCUVW') - {a}) for a in 'XYZABCUVW')
         for axis in 'XYZABCUVW':
             # set to 100
             setattr(p, axis, 100)
             self.assertEqual(getattr(p, axis), 100)
-            for inner_axis in set('XYZABCUVW') - {axis}:  # no other axis has changed
+            for inner_axis in other_axes[axis]:  # no other axis has changed
                 self.assertEqual(getattr(p, inner_axis), 0), "axis '%s'" % inner_axis
             # revert back to zero
             setattr(p, axis, 0)
             self.assertEqual(getattr(p, axis), 0)
 
+    def test_item_access(self):
+        p = Position(axes='XYZ', X=1)
+        self.assertEqual(p['X'], 1)
+        p['Y'] = 2
+        self.assertEqual(p.Y, 2)
+        with self.assertRaises(KeyError):
+            p['A']
+        with self.assertRaises(MachineInvalidAxis):
+            p['A'] = 3
+
     # Equality
     def test_equality(self):
         p1 = Position(axes='XYZ', X=1, Y=2)
@@ -85,6 +103,32 @@ class PositionTests(unittest.TestCase):
         p = Position(axes='XYZ', X=2, Y=10)
         self.assertEqual(p / 2, Position(axes='XYZ', X=1, Y=5))
 
+    def test_unit_conversion(self):
+        p = Position(axes='XYZ', X=25.4, Y=-50.8, unit=UNIT_METRIC)
+        p.unit = UNIT_IMPERIAL
+        self.assertEqual(p.unit, UNIT_IMPERIAL)
+        self.assertAlmostEqual(p.X, 1)
+        self.assertAlmostEqual(p.Y, -2)
+        self.assertEqual(p.Z, 0)
+
+
+class MachineModeTests(unittest.TestCase):
+    def test_default_mode_independent(self):
+        m1 = Machine()
+        m1.mode.feed_rate.word.value = 100
+        self.assertEqual(str(m1.mode.feed_rate), 'F100')
+        m2 = Machine()
+        self.assertEqual(str(m2.mode.feed_rate), 'F0')
+
+    def test_copied_mode_independent(self):
+        m1 = Machine()
+        m1.process_str('G1 X1 F200')
+        m2 = copy(m1)
+        self.assertEqual(str(m2.mode.feed_rate), 'F200')
+        self.assertIsNot(m1.mode.motion.word, m2.mode.motion.word)
+        m2.mode.feed_rate.word.value = 999
+        self.assertEqual(str(m1.mode.feed_rate), 'F200')
+
 
 class MachineGCodeProcessingTests(unittest.TestCase):
     def assert_processed_lines(self, line_data, machine):
@@ -1,7 +1,6 @@
 import os
 import inspect
 import re
-import glob
 import unittest
 
 # Add relative pygcode to path
@@ -28,18 +27,19 @@ class FileParsingTest(unittest.TestCase):
     def test_file(self):
         m = Machine()
         with open(self.filename, 'r') as fh:
-            for line_str in fh.readlines():
+            for line_str in fh:  # (streamed)
                 line = Line(line_str)
-                m.process_block(line.block)
+                if line.block:
+                    m.process_block(line.block)
 
 
 # Get list of test files
-_filetype_regex = re.compile(r'\.(tap|nc|ngc|gcode)$', re.IGNORECASE)
+_filetype_extensions = ('.tap', '.nc', '.ngc', '.gcode')
 _test_files = set()
 for dialect in ['linuxcnc']:  # FIXME: get list of all dialects
-    for filename in glob.glob(os.path.join(_test_files_dir, dialect, '*')):
-        if _filetype_regex.search(filename):
-            _test_files.add(filename)
+    for entry in os.scandir(os.path.join(_test_files_dir, dialect)):
+        if entry.is_file() and entry.name.lower().endswith(_filetype_extensions):
+            _test_files.add(entry.path)
 
 # remove default test file:
 _test_files.discard(FileParsingTest.filename)
@@ -26,7 +26,9 @@ add_pygcode_to_path()
 
 
 # String Utilities
+_str_lines_regex = re.compile(r'\s*(?P<content>.*?)\s*\n')
+
 def str_lines(text):
     """Split given string into lines (ignore blank lines, and automagically strip)"""
-    for match in re.finditer(r'\s*(?P<content>.*?)\s*\n', text):
+    for match in _str_lines_regex.finditer(text):
         yield match.group('content')